@@ -20,10 +20,15 @@ headers = {
     'Content-Type': 'application/json'
 }
 
+# Shared session so every call reuses the same TLS connection to Jira
+session = requests.Session()
+session.auth = auth
+session.headers.update(headers)
+
 def get_current_user():
     """Get the current authenticated user"""
     url = f"{JIRA_URL}/rest/api/3/myself"
-    response = requests.get(url, headers=headers, auth=auth)
+    response = session.get(url)
     
     if response.status_code == 200:
         return response.json()
@@ -41,7 +46,7 @@ def search_issues(jql, max_results=100):
         'fields': 'key,summary,status,updated,assignee,priority,issuetype'
     }
     
-    response = requests.get(url, headers=headers, auth=auth, params=params)
+    response = session.get(url, params=params)
     
     print(f"Response: {response.status_code} {response.reason}")
     
@@ -9,24 +9,24 @@ Usage:
 """
 
 import os
+import re
 import sys
 import requests
+from functools import lru_cache
 from pathlib import Path
 
-def load_env_file():
-    """Load .env file and return dict of values"""
-    env_path = Path(".env")
-    env_vars = {}
+# KEY=value lines; blank lines and comments never match
+_ENV_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+@lru_cache(maxsize=None)
+def load_env_file(path=".env"):
+    """Load .env file and return dict of values (parsed once per path)"""
+    env_path = Path(path)
     
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
+    if not env_path.exists():
+        return {}
     
-    return env_vars
+    return dict(_ENV_RE.findall(env_path.read_text()))
 
 def main():
     # Get message from command line or use default